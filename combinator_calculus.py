@@ -1,13 +1,26 @@
 from __future__ import annotations
 from abc import ABC
-from dataclasses import dataclass
-from enum import Enum
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import os
 from unify import Unifier as _Unifier
 from typing import Any, ClassVar, Literal, Optional
+from weakref import WeakValueDictionary
 
 BuiltinTypedTerm = str | tuple[Any, ...]
 #BuiltinTypedTerm = str | tuple[BuiltinTypedTerm, ...]
 
+# integer kind tags carried by every term, used for dispatch in reduce1
+_VAR_KIND = 0
+_S_KIND = 1
+_K_KIND = 2
+_APP_KIND = 3
+_PRIM_KIND = 4 # a primitive combinator with no reduction rule
+
+# the concrete term classes that may not be subclassed; populated once
+# they are all defined
+_FINAL_TERM_CLASSES: set[type] = set()
+
 class Term(ABC):
 	"""A term in a combinator calculus.
 
@@ -17,168 +30,742 @@ class Term(ABC):
 	'SKK'
 	>>> str(App(Var("x"), Var("x'")))
 	"x<x'>"
+
+	Terms are interned: constructing a term structurally equal to one that
+	already exists returns the existing object. Equality and hashing are
+	therefore simple identity checks (the defaults), and structural
+	comparisons elsewhere in the module can be written with 'is'.
 	"""
+	__slots__ = ()
+
+	kind: ClassVar[int]
+
+	# the number of nodes in the term, and the set of names of its free
+	# variables; computed once at construction, so that size and
+	# occurrence queries are O(1)
+	size: int
+	fv: frozenset[str]
+
+	def __init_subclass__(cls, **kwargs):
+		# the hot paths dispatch on exact type ('type(t) is App' and the
+		# like), which is only sound if the concrete classes are final
+		for base in cls.__bases__:
+			if base in _FINAL_TERM_CLASSES:
+				raise TypeError(f'{base.__name__} cannot be subclassed')
+
+		super().__init_subclass__(**kwargs)
 
-@dataclass
 class Var(Term):
 	"""A variable in a combinator calculus."""
+	__slots__ = ('name', 'fv', '__weakref__')
 	name: str
+	kind = _VAR_KIND
+	size = 1
+
+	_intern: ClassVar[WeakValueDictionary[str, Var]] = WeakValueDictionary()
+
+	def __new__(cls, name: str) -> Var:
+		try:
+			return cls._intern[name]
+		except KeyError:
+			var = super().__new__(cls)
+			var.name = name
+			var.fv = frozenset((name,))
+			cls._intern[name] = var
+			return var
+
+	def __repr__(self):
+		return f'Var(name={self.name!r})'
 
 	def __str__(self):
 		return self.name if len(self.name) == 1 else f'<{self.name}>'
 
-@dataclass
 class PrimComb(Term):
-	"""A primitive combinator in a combinator calculus."""
-	S: ClassVar[PrimComb] 
+	"""A primitive combinator in a combinator calculus.
+
+	S and K have their own subclasses (so that they carry their kind tags
+	at class level), but are still constructed by name through this class:
+	PrimComb('S') is PrimComb.S."""
+	__slots__ = ('name', '_args', '_fun_sym', '__weakref__')
+	S: ClassVar[PrimComb]
 	K: ClassVar[PrimComb]
 	name: str
+	kind = _PRIM_KIND
+	size = 1
+	fv = frozenset()
+
+	_intern: ClassVar[WeakValueDictionary[str, PrimComb]] \
+		= WeakValueDictionary()
+
+	def __new__(cls, name: str) -> PrimComb:
+		try:
+			return cls._intern[name]
+		except KeyError:
+			comb = object.__new__(_PRIM_CLASSES.get(name, PrimComb))
+			comb.name = name
+			comb._args = ()
+			comb._fun_sym = comb
+			cls._intern[name] = comb
+			return comb
+
+	def __repr__(self):
+		return f'PrimComb(name={self.name!r})'
 
 	def __str__(self):
 		return self.name
 
+class PrimCombS(PrimComb):
+	"""The primitive combinator S."""
+	__slots__ = ()
+	kind = _S_KIND
+
+class PrimCombK(PrimComb):
+	"""The primitive combinator K."""
+	__slots__ = ()
+	kind = _K_KIND
+
+_PRIM_CLASSES: dict[str, type[PrimComb]] = {'S': PrimCombS, 'K': PrimCombK}
+
 PrimComb.S = PrimComb('S')
 PrimComb.K = PrimComb('K')
 
-@dataclass
 class App(Term):
 	"""The application of one term to another in a combinator calculus."""
+	__slots__ = ('left', 'right', 'size', 'fv', '_str', '_args', '__weakref__')
 	left: Term
 	right: Term
+	kind = _APP_KIND
+
+	# the App class itself serves as the function symbol of an application
+	_fun_sym: ClassVar[type[App]]
+
+	# since subterms are themselves interned, identity of the children
+	# determines identity of the application, so we can key on their ids
+	_intern: ClassVar[WeakValueDictionary[tuple[int, int], App]] \
+		= WeakValueDictionary()
+
+	def __new__(cls, left: Term, right: Term) -> App:
+		key = (id(left), id(right))
+
+		try:
+			return cls._intern[key]
+		except KeyError:
+			app = super().__new__(cls)
+			app.left = left
+			app.right = right
+			app.size = left.size + right.size + 1
+			app.fv = left.fv | right.fv
+			app._str = None
+			app._args = (left, right)
+			cls._intern[key] = app
+			return app
+
+	def __repr__(self):
+		return f'App(left={self.left!r}, right={self.right!r})'
 
 	def __str__(self):
-		right_str = str(self.right)
+		# since the term is interned and immutable, the rendered string can
+		# be cached on it, so each distinct subterm is formatted only once
+		if self._str is None:
+			if type(self.right) is App:
+				self._str = ''.join(
+					(str(self.left), '(', str(self.right), ')')
+				)
+			else:
+				self._str = str(self.left) + str(self.right)
 
-		if isinstance(self.right, App):
-			right_str = f'({right_str})'
+		return self._str
 
-		return f'{self.left}{right_str}'
+App._fun_sym = App
 
-def parse_term(src: str, i0: int) -> tuple[Term, int]:
-	i: int = i0
-	acc: Optional[Term] = None
+_FINAL_TERM_CLASSES.update((Var, PrimCombS, PrimCombK, App))
+
+_PRIM_COMBS = {'S': PrimComb.S, 'K': PrimComb.K}
 
-	def acc_append(acc, t):
-		return t if acc is None else App(acc, t)
+def parse(src: str) -> Term:
+	"""
+	>>> parse('SKK')
+	App(left=App(left=PrimComb(name='S'), right=PrimComb(name='K')), right=PrimComb(name='K'))
 
-	while i < len(src):
-		char = src[i]
+	The parser is a single loop over the source string with an explicit
+	stack of partial terms, one entry per open bracket, so deeply nested
+	terms don't run into the recursion limit. The parsed term is passed
+	through 'simplify' before being returned.
+	"""
+	# each stack entry is the term accumulated before an open bracket,
+	# together with the bracket's index for error reporting
+	stack: list[tuple[Optional[Term], int]] = []
+	acc: Optional[Term] = None
 
+	for i, char in enumerate(src):
 		if char in 'SK':
-			acc = acc_append(acc, PrimComb(char))
-			i += 1
+			comb = _PRIM_COMBS[char]
+			acc = comb if acc is None else App(acc, comb)
 		elif char == '(':
-			term, i = parse_term(src, i + 1)
-			acc = acc_append(acc, term)
+			stack.append((acc, i))
+			acc = None
 		elif char == ')':
-			i += 1
-			break
+			if not stack:
+				raise ValueError(f'extraneous closing bracket at index {i}')
+
+			if acc is None:
+				raise ValueError(
+					f'the empty string cannot be parsed as a term'
+				)
+
+			outer, _ = stack.pop()
+			acc = acc if outer is None else App(outer, acc)
 		else:
 			raise ValueError(f'invalid character at index {i}')
 
-	else: # if we terminate by reaching the end of the string rather than
-		  # hitting a closing bracket
-
-		if i0 != 0:
-			raise ValueError(f'opening bracket at index {i0 - 1} not closed')
+	if stack:
+		raise ValueError(
+			f'opening bracket at index {stack[-1][1]} not closed'
+		)
 
 	if acc is None:
 		raise ValueError(f'the empty string cannot be parsed as a term')
 
-	return acc, i
-
-def parse(src: str) -> Term:
+	return simplify(acc)
+
+# the canonical identity combinator, S K K
+_IDENTITY = App(App(PrimComb.S, PrimComb.K), PrimComb.K)
+
+def _simplify_app(left: Term, right: Term) -> Term:
+	# 'left' and 'right' are assumed to be simplified already
+	if type(left) is App:
+		inner = left.left
+
+		if inner is PrimComb.K: # K x y -> x
+			return left.right
+
+		if inner is PrimComb.S:
+			# S K y x reduces to x whatever y is, so S K y is
+			# (extensionally) the identity; canonicalize it to S K K
+			if left.right is PrimComb.K:
+				return _IDENTITY
+
+			# S (K x) (K y) -> K (x y)
+			if (
+				type(left.right) is App
+				and left.right.left is PrimComb.K
+				and type(right) is App
+				and right.left is PrimComb.K
+			):
+				return App(
+					PrimComb.K,
+					_simplify_app(left.right.right, right.right)
+				)
+
+	return App(left, right)
+
+def simplify(term: Term) -> Term:
+	"""Shrink 'term' by rewriting some well-known identities.
+
+	The rewrites (K x y -> x, S K y -> S K K, S (K x) (K y) -> K (x y))
+	are applied bottom-up. The guarantee is observational equivalence
+	only: the rewritten term, applied to any arguments, denotes the same
+	function as the original so applied - NOT that the two ever reduce to
+	the same normal form. S K S simplifies to S K K, for instance, and
+	S (S K S) x and S (S K K) x are distinct normal forms. A rewritten
+	subterm can even survive unreduced inside the normal form of a fully
+	applied term: x (S K S) and x (S K K) are both normal forms, and no
+	number of further arguments ever forces an argument of the variable
+	head, so they stay distinct forever. Since parse runs this pass, two
+	sources for 'the same' term can print differently; they are
+	interchangeable only as functions.
 	"""
-	>>> parse('SKK')
-	App(left=App(left=PrimComb(name='S'), right=PrimComb(name='K')), right=PrimComb(name='K'))
-	"""
-	term, i = parse_term(src, 0)
+	if type(term) is not App:
+		return term
 
-	if i != len(src):
-		raise ValueError(f'extraneous closing bracket at index {i - 1}')
+	# iterative bottom-up traversal, in the style of TermArena.from_term,
+	# so deeply nested terms don't run into the recursion limit
+	results: dict[Term, Term] = {}
+	stack = [term]
 
-	return term
+	while stack:
+		t = stack[-1]
 
-def reduce1(term: Term) -> Optional[Term]:
-	if isinstance(term, (Var, PrimComb)):
-		return term
+		if t in results:
+			stack.pop()
+		elif type(t) is not App:
+			stack.pop()
+			results[t] = t
+		else:
+			left = results.get(t.left)
+			right = results.get(t.right)
+
+			if left is None or right is None:
+				if right is None:
+					stack.append(t.right)
+
+				if left is None:
+					stack.append(t.left)
+			else:
+				stack.pop()
+				results[t] = _simplify_app(left, right)
 
-	# sadly mypy does not yet support the match statement so we have to make do
-	# with this monstrosity
-	if isinstance(term, App):
-		if isinstance(term.left, App):
-			if isinstance(term.left.left, App):
-				if term.left.left.left == PrimComb.S:
-					return App(
-						App(term.left.left.right, term.right),
-						App(term.left.right, term.right)
-					)
-			
-			if term.left.left == PrimComb.K:
-				return term.left.right
+	return results[term]
 
-		left_reduced = reduce1(term.left)
+def _contract_k(term: App) -> Optional[Term]:
+	# term = App(App(K, x), y) -> x
+	return term.left.right
 
-		if left_reduced is None:
-			right_reduced = reduce1(term.right)
+def _contract_s(term: App) -> Optional[Term]:
+	# term = App(App(App(?, x), y), z); fires only if ? is S
+	inner = term.left.left
 
-			if right_reduced is None:
-				return None
+	if inner.left.kind != _S_KIND:
+		return None
 
-			return App(term.left, right_reduced)
+	return App(
+		App(inner.right, term.right),
+		App(term.left.right, term.right)
+	)
 
-		return App(left_reduced, term.right)
+# maps the packed kind-code of a candidate redex (see reduce1) to the
+# function computing its contractum
+_REDEX_HANDLERS = {
+	_APP_KIND << 4 | _K_KIND: _contract_k,
+	_APP_KIND << 4 | _APP_KIND: _contract_s,
+}
 
-	raise ValueError(f'{term} is not a term')
+def reduce1(term: Term) -> Optional[Term]:
+	"""Perform a single reduction step on 'term'.
+
+	Returns None if 'term' contains no redex."""
+	if term.kind != _APP_KIND:
+		return None
+
+	# pack the kinds of the left child and (if it is an application) its
+	# own left child into a single code, so redex recognition is one dict
+	# lookup rather than a chain of isinstance checks
+	left = term.left
+	code = left.kind
+
+	if code == _APP_KIND:
+		code = code << 4 | left.left.kind
+
+	handler = _REDEX_HANDLERS.get(code)
+
+	if handler is not None:
+		contractum = handler(term)
+
+		if contractum is not None:
+			return contractum
+
+	# if a child comes back unchanged (by identity), reuse the existing
+	# node rather than going back through the intern table
+	left_reduced = reduce1(left)
+
+	if left_reduced is not None:
+		return term if left_reduced is left else App(left_reduced, term.right)
+
+	right_reduced = reduce1(term.right)
+
+	if right_reduced is None:
+		return None
+
+	return term if right_reduced is term.right else App(left, right_reduced)
+
+class TermArena:
+	"""A struct-of-arrays store for terms.
+
+	Nodes live in three parallel arrays and are identified by integer
+	indices, so a node costs a few bytes rather than a whole Python object
+	and traversal chases array entries rather than heap pointers. For an
+	application node, 'lefts' and 'rights' hold the ids of the two
+	subterms; for a variable or primitive combinator, 'lefts' holds an
+	index into 'atoms', where the original Term object is kept for
+	conversion back. Kind tags are the same ones the Term classes carry.
+
+	reduce uses an arena internally; the object representation remains the
+	public interface."""
+	__slots__ = ('kinds', 'lefts', 'rights', 'atoms', '_ids', '_apps', '_nfs')
+
+	def __init__(self):
+		self.kinds = array('B')
+		self.lefts = array('l')
+		self.rights = array('l')
+		self.atoms: list[Term] = []
+		self._ids: dict[Term, int] = {} # interned term -> node id
+		self._apps: dict[tuple[int, int], int] = {} # hash-consing for apps
+		self._nfs: dict[int, int] = {} # node id -> normal-form id
+
+	def new_app(self, left: int, right: int) -> int:
+		key = (left, right)
+
+		try:
+			return self._apps[key]
+		except KeyError:
+			i = len(self.kinds)
+			self.kinds.append(_APP_KIND)
+			self.lefts.append(left)
+			self.rights.append(right)
+			self._apps[key] = i
+			return i
+
+	def _new_atom(self, term: Term) -> int:
+		try:
+			return self._ids[term]
+		except KeyError:
+			i = len(self.kinds)
+			self.kinds.append(term.kind)
+			self.lefts.append(len(self.atoms))
+			self.rights.append(-1)
+			self.atoms.append(term)
+			self._ids[term] = i
+			return i
+
+	def new_var(self, var: Var) -> int:
+		return self._new_atom(var)
+
+	def new_prim(self, comb: PrimComb) -> int:
+		return self._new_atom(comb)
+
+	def from_term(self, term: Term) -> int:
+		"""Copy 'term' into the arena and return its node id."""
+		ids = self._ids
+		stack = [term]
+
+		# iterative bottom-up conversion, so left spines of any depth
+		# don't hit the recursion limit
+		while stack:
+			t = stack[-1]
+
+			if t in ids:
+				stack.pop()
+			elif t.kind == _APP_KIND:
+				left_id = ids.get(t.left)
+				right_id = ids.get(t.right)
+
+				if left_id is None or right_id is None:
+					if right_id is None:
+						stack.append(t.right)
+
+					if left_id is None:
+						stack.append(t.left)
+				else:
+					stack.pop()
+					ids[t] = self.new_app(left_id, right_id)
+			else:
+				stack.pop()
+				self._new_atom(t)
+
+		return ids[term]
+
+	def to_term(self, i: int) -> Term:
+		"""Convert the node with id 'i' back into an interned Term."""
+		kinds = self.kinds
+		lefts = self.lefts
+		rights = self.rights
+		atoms = self.atoms
+		terms: dict[int, Term] = {}
+		stack = [i]
+
+		while stack:
+			j = stack[-1]
+
+			if j in terms:
+				stack.pop()
+			elif kinds[j] == _APP_KIND:
+				left = terms.get(lefts[j])
+				right = terms.get(rights[j])
+
+				if left is None or right is None:
+					if right is None:
+						stack.append(rights[j])
+
+					if left is None:
+						stack.append(lefts[j])
+				else:
+					stack.pop()
+					terms[j] = App(left, right)
+			else:
+				stack.pop()
+				terms[j] = atoms[lefts[j]]
+
+		return terms[i]
+
+	def reduce(self, i: int) -> int:
+		"""Return the id of the normal form of the node with id 'i'."""
+		try:
+			return self._nfs[i]
+		except KeyError:
+			pass
+
+		kinds = self.kinds
+		lefts = self.lefts
+		rights = self.rights
+		nfs = self._nfs
+
+		# each frame is [original id, head-so-far, argument ids still to
+		# attach (innermost last)]; a frame whose head is None has not
+		# been head-reduced yet. Frames for unnormalized arguments are
+		# pushed on top, so no Python recursion is involved, in the same
+		# style as from_term/to_term.
+		stack: list[list[Any]] = [[i, None, None]]
+
+		while stack:
+			frame = stack[-1]
+
+			if frame[1] is None:
+				# unwind the left spine onto the argument list, firing
+				# S/K redexes at the head until none remain
+				t = frame[0]
+				spine: list[int] = []
+
+				while True:
+					kind = kinds[t]
+
+					if kind == _APP_KIND:
+						spine.append(rights[t])
+						t = lefts[t]
+					elif kind == _K_KIND and len(spine) >= 2:
+						x = spine.pop()
+						spine.pop()
+						t = x
+					elif kind == _S_KIND and len(spine) >= 3:
+						x = spine.pop()
+						y = spine.pop()
+						z = spine.pop()
+						t = self.new_app(
+							self.new_app(x, z), self.new_app(y, z)
+						)
+					else:
+						break
+
+				frame[1] = t
+				frame[2] = spine
+
+			# attach the arguments whose normal forms are already known,
+			# innermost first
+			spine = frame[2]
+
+			while spine:
+				arg_nf = nfs.get(spine[-1])
+
+				if arg_nf is None:
+					break
+
+				spine.pop()
+				frame[1] = self.new_app(frame[1], arg_nf)
+
+			if spine:
+				stack.append([spine[-1], None, None])
+			else:
+				nfs[frame[0]] = frame[1]
+				stack.pop()
+
+		return nfs[i]
+
+# maps interned terms to their normal forms; since terms hash by identity
+# this is an identity-keyed cache, and shared subterms are only ever
+# reduced once
+_REDUCE_CACHE: dict[Term, Term] = {}
+
+def clear_reduce_cache() -> None:
+	"""Clear the memoization cache used by 'reduce'."""
+	_REDUCE_CACHE.clear()
 
 def reduce(term: Term) -> Term:
-	while True:
-		reduced = reduce1(term)
+	"""Reduce 'term' to its normal form, if it has one.
+
+	The work happens in a TermArena: the term is copied into the arena,
+	reduced there on integer node ids, and the normal form converted back
+	to an interned Term."""
+	try:
+		return _REDUCE_CACHE[term]
+	except KeyError:
+		pass
+
+	arena = TermArena()
+	reduced = arena.to_term(arena.reduce(arena.from_term(term)))
+	_REDUCE_CACHE[term] = reduced
+	return reduced
+
+_COMPILE_CACHE: dict[tuple[Term, int], Any] = {}
+
+def compile_term(term: Term, arity: int):
+	"""Compile 'term' into a function of 'arity' argument terms.
+
+	The returned function f is such that f(a1, ..., an) is the normal form
+	of 'term' applied to a1, ..., an. It is built by reducing 'term'
+	applied to fresh placeholder variables once, then generating Python
+	source that rebuilds the residual normal form directly from the actual
+	arguments - so the S/K steps internal to 'term' are paid once at
+	compile time rather than on every call, and only redexes created by
+	the arguments themselves remain for the final reduce.
+
+	>>> b = compile_term(parse('S(KS)K'), 3) # the composition combinator
+	>>> str(b(Var('f'), Var('g'), Var('x')))
+	'f(gx)'
+	"""
+	try:
+		return _COMPILE_CACHE[term, arity]
+	except KeyError:
+		pass
+
+	# Var is interned, so a variable of 'term' with a placeholder's name
+	# would BE that placeholder; pick names disjoint from term.fv
+	placeholders: list[Var] = []
+	candidate = 0
+
+	while len(placeholders) < arity:
+		name = f'_a{candidate}'
+		candidate += 1
+
+		if name not in term.fv:
+			placeholders.append(Var(name))
+
+	applied = term
+
+	for placeholder in placeholders:
+		applied = App(applied, placeholder)
+
+	template = reduce(applied)
+
+	placeholder_ids = {
+		id(placeholder): f'a{i}'
+		for i, placeholder in enumerate(placeholders)
+	}
+	placeholder_names = frozenset(
+		placeholder.name for placeholder in placeholders
+	)
+	namespace: dict[str, Any] = {'App': App, 'reduce': reduce}
+	consts: dict[Term, str] = {}
+
+	def emit(t: Term) -> str:
+		name = placeholder_ids.get(id(t))
+
+		if name is not None:
+			return name
+
+		# whether 't' contains any of the placeholders is a free-variable
+		# query, which the term answers in O(1)
+		if not placeholder_names.isdisjoint(t.fv):
+			return f'App({emit(t.left)}, {emit(t.right)})'
+
+		# a placeholder-free subterm is hoisted into the namespace as a
+		# ready-made constant
+		const_name = consts.get(t)
+
+		if const_name is None:
+			const_name = f'c{len(consts)}'
+			consts[t] = const_name
+			namespace[const_name] = t
+
+		return const_name
+
+	params = ', '.join(f'a{i}' for i in range(arity))
+	source = f'def specialized({params}):\n\treturn reduce({emit(template)})'
+	exec(source, namespace)
+	compiled = namespace['specialized']
+	_COMPILE_CACHE[term, arity] = compiled
+	return compiled
+
+def _encode(term: Term) -> tuple[Any, ...]:
+	"""Encode 'term' as nested tuples for sending between processes.
+
+	Interned terms can't be pickled directly (unpickling would bypass the
+	intern tables), so worker processes exchange this plain-data form and
+	rebuild interned terms on their own side."""
+	if type(term) is App:
+		return ('app', _encode(term.left), _encode(term.right))
 
-		if reduced is None:
-			return term
+	if type(term) is Var:
+		return ('var', term.name)
 
-		term = reduced
+	return ('prim', term.name)
 
-class FunSym(Enum):
-	S = PrimComb.S
-	K = PrimComb.K
-	App = App
+def _decode(encoded: tuple[Any, ...]) -> Term:
+	tag = encoded[0]
+
+	if tag == 'app':
+		return App(_decode(encoded[1]), _decode(encoded[2]))
+
+	if tag == 'prim':
+		return PrimComb(encoded[1])
+
+	return Var(encoded[1])
+
+def _reduce_encoded(encoded: tuple[Any, ...]) -> tuple[Any, ...]:
+	return _encode(reduce(_decode(encoded)))
+
+def reduce_many(terms: list[Term]) -> list[Term]:
+	"""Reduce each of 'terms' to its normal form, in parallel.
+
+	The terms are independent of each other, so they are farmed out to a
+	pool of worker processes; this pays off for batches of non-trivial
+	reductions, while small batches are reduced in-process."""
+	if len(terms) < 2:
+		return [reduce(term) for term in terms]
+
+	chunksize = max(1, len(terms) // ((os.cpu_count() or 1) * 4))
+
+	with ProcessPoolExecutor() as executor:
+		return [
+			_decode(encoded) for encoded in executor.map(
+				_reduce_encoded, map(_encode, terms), chunksize=chunksize
+			)
+		]
+
+# a function symbol is either a primitive combinator (applied to no
+# arguments) or the App class itself (applied to two)
+FunSym = PrimComb | type[App]
 
 class Unifier(_Unifier[FunSym, Var, App]):
 	@classmethod
 	def apply(cls, f, args):
+		if f is App and len(args) == 2:
+			return App(*args)
+
 		if isinstance(f, PrimComb):
 			return f
 
-		if f == App and len(args) == 2:
-			return App(*args)
-
 		raise ValueError(f'cannot apply {f} to {args}')
 
 	@classmethod
 	def is_var(cls, term):
-		return isinstance(term, Var)
+		# Var is final (see Term.__init_subclass__), so an exact type
+		# check is equivalent to isinstance, and faster
+		return type(term) is Var
 
 	@classmethod
 	def fun_sym(cls, term):
-		if isinstance(term, PrimComb):
-			return term
-
-		if isinstance(term, App):
-			return App
-
-		raise ValueError(f'{term} is not an application')
+		# pre-stored on the term at construction, so this is a single
+		# attribute load
+		try:
+			return term._fun_sym
+		except AttributeError:
+			raise ValueError(f'{term} is not an application') from None
 
 	@classmethod
 	def args(cls, term):
-		if isinstance(term, PrimComb):
-			return ()
+		# the tuple is built once at construction and shared across calls
+		try:
+			return term._args
+		except AttributeError:
+			raise ValueError(f'{term} is not an application') from None
+
+	@classmethod
+	def occurs_in(cls, var, term, _seen=None):
+		"""Return whether 'var' occurs in 'term'.
 
-		if isinstance(term, App):
-			return (term.left, term.right)
+		O(1), using the free-variable set stored on each interned node."""
+		return var.name in term.fv
 
-		raise ValueError(f'{term} is not an application')
+	@classmethod
+	def fast_decompose(cls, left, right):
+		# every App has exactly two arguments, so an equation between two
+		# Apps decomposes without going through fun_sym/args at all
+		if type(left) is App and type(right) is App:
+			return (
+				(left.left, right.left),
+				(left.right, right.right),
+			)
+
+		return None
 
 unify = Unifier.unify
 unify2 = Unifier.unify2
@@ -60,24 +60,87 @@ class Unifier(ABC, Generic[FunSymT, VarT, AppT]):
         """Return the arguments 'app' is an application to."""
 
     @classmethod
-    def occurs_in(cls, var: VarT, term: TermT) -> bool:
+    def fast_decompose(
+        cls, left: AppT, right: AppT
+    ) -> Optional[Sequence[tuple[TermT, TermT]]]:
+        """Decompose an equation between two applications, if possible.
+
+        Returns the equations between corresponding arguments, or None to
+        fall back on the generic fun_sym/args path. The default always
+        returns None; implementations whose applications have a known
+        fixed shape can override this to skip the per-argument calls to
+        'args' in 'unify'."""
+        return None
+
+    @classmethod
+    def occurs_in(
+        cls, var: VarT, term: TermT, _seen: Optional[set[int]]=None
+    ) -> bool:
         """Return whether 'var' occurs in 'term'."""
         if cls.is_var(term):
             return var == term
 
-        return any(cls.occurs_in(var, arg) for arg in cls.args(term))
+        # skip subterms shared by identity that have already been scanned,
+        # so a term is only ever traversed as a DAG, not as its unfolding
+        if _seen is None:
+            _seen = set()
+        elif id(term) in _seen:
+            return False
+
+        _seen.add(id(term))
+        occurs_in = cls.occurs_in # avoid one class-dict lookup per arg
+        return any(occurs_in(var, arg, _seen) for arg in cls.args(term))
 
     @classmethod
     def subst(cls, s: dict[VarT, TermT], term: TermT) -> TermT:
         """Return the image of 'term' under the substitution map induced by 's'.
+
+        Subterms left unchanged by the substitution are returned as-is
+        rather than rebuilt, so the result shares structure with 'term'
+        wherever possible, and subterms shared within 'term' (by identity)
+        are only processed once.
         """
-        if cls.is_var(term):
-            return s.get(term, term)
+        if not s:
+            return term
+
+        # bind the methods the loop calls to locals, so each call is a
+        # LOAD_FAST rather than a lookup through the class
+        is_var = cls.is_var
+        args_of = cls.args
+
+        # maps id(subterm) -> substituted subterm; ids are stable here
+        # since 'term' keeps its subterms alive for the duration
+        results: dict[int, TermT] = {}
+        stack = [term]
+
+        while stack:
+            t = stack[-1]
+
+            if id(t) in results:
+                stack.pop()
+                continue
+
+            if is_var(t):
+                stack.pop()
+                results[id(t)] = s.get(t, t)
+                continue
+
+            args = args_of(t)
+            missing = [arg for arg in args if id(arg) not in results]
 
-        return cls.apply(
-            cls.fun_sym(term),
-            tuple(cls.subst(s, arg) for arg in cls.args(term))
-        )
+            if missing:
+                stack.extend(missing)
+                continue
+
+            stack.pop()
+            new_args = tuple(results[id(arg)] for arg in args)
+
+            if all(new is old for new, old in zip(new_args, args)):
+                results[id(t)] = t
+            else:
+                results[id(t)] = cls.apply(cls.fun_sym(t), new_args)
+
+        return results[id(term)]
 
     @classmethod
     def unify(
@@ -90,50 +153,244 @@ class Unifier(ABC, Generic[FunSymT, VarT, AppT]):
         If 'subst' is not None, returns the most general unifier that
         specializes 'subst'.
 
-        The equations should be encoded as 2-tuples."""
-        if subst is None:
-            subst = {}
+        The equations should be encoded as 2-tuples.
 
-        while equations:
-            left, right = equations.pop()
+        Internally this keeps a union-find forest over the variables, with
+        each equivalence class optionally bound to a non-variable term, and
+        applies the accumulated substitution only once at the end. Binding
+        a variable is therefore O(1) rather than a rescan of every pending
+        equation and existing binding, making the whole algorithm
+        near-linear in the total size of the terms.
 
-            if left == right:
-                continue
+        When two variables are merged, the binding ends up on the
+        representative, but both appear in the result:
 
-            if cls.is_var(left):
-                if cls.occurs_in(left, right):
-                    raise UnificationError(f'{left} occurs in {right}')
+        >>> unify([('y', 'x'), (('c',), 'y')])
+        {'y': ('c',), 'x': ('c',)}
+
+        Merging a variable into a class can make the class's existing
+        binding cyclic, which is an error like any other occurrence:
+
+        >>> unify([('y', 'w'), (('f', 'y'), 'w')])
+        Traceback (most recent call last):
+          ...
+        UnificationError: w occurs in ('f', 'y')
+
+        Bindings propagate through chains of variable equations:
+
+        >>> unify([('x', 'y'), ('y', ('g', 'z')), ('z', ('k',))])
+        {'z': ('k',), 'y': ('g', ('k',)), 'x': ('g', ('k',))}
 
-                new_subst = {left: right}
+        The occurs check looks through bindings made earlier, not just at
+        the literal term:
 
-                for i, (l, r) in enumerate(equations):
-                    equations[i] = (
-                        cls.subst(new_subst, l),
-                        cls.subst(new_subst, r)
-                    )
+        >>> unify([('x', ('f', 'y')), ('y', ('h', 'x'))])
+        Traceback (most recent call last):
+          ...
+        UnificationError: x occurs in ('f', 'y')
+
+        An initial substitution is refined along with everything else:
+
+        >>> unify([('y', ('b',))], {'x': ('g', 'y')})
+        {'x': ('g', ('b',)), 'y': ('b',)}
+        """
+        # bind the methods the loop calls to locals, so each call is a
+        # LOAD_FAST rather than a lookup through the class
+        is_var = cls.is_var
+        args_of = cls.args
+        fun_sym = cls.fun_sym
+        apply = cls.apply
+        fast_decompose = cls.fast_decompose
+
+        # union-find forest: maps a variable to another variable in the
+        # same equivalence class; a variable with no entry is the
+        # representative of its class
+        parent: dict[VarT, VarT] = {}
+
+        # maps a representative to the non-variable term its class is
+        # bound to, if any
+        terms: dict[VarT, TermT] = {}
+
+        # the variables that have been bound, in binding order
+        bound: list[VarT] = []
+
+        def find(var: VarT) -> VarT:
+            root = var
+
+            while root in parent:
+                root = parent[root]
+
+            while var != root: # path compression
+                parent[var], var = root, parent[var]
+
+            return root
+
+        def occurs(var: VarT, term: TermT) -> bool:
+            # like occurs_in, but looks through the bindings accumulated
+            # so far; 'var' should be a representative
+            stack = [term]
+            seen: set[int] = set()
+
+            while stack:
+                t = stack.pop()
+
+                if is_var(t):
+                    t = find(t)
+
+                    if t == var:
+                        return True
+
+                    t_term = terms.get(t)
+
+                    if t_term is not None:
+                        stack.append(t_term)
+                elif id(t) not in seen:
+                    seen.add(id(t))
+                    stack.extend(args_of(t))
+
+            return False
+
+        # seed with the existing bindings, so that the result specializes
+        # 'subst'
+        if subst is not None:
+            equations.extend(subst.items())
+
+        # 'equations' is used as a stack with an explicit top index: slots
+        # below 'top' are live, and pushing overwrites a dead slot when one
+        # is available rather than growing the list, so the buffer only
+        # ever grows to the high-water mark of pending equations
+        top = len(equations)
+
+        def push(equation: tuple[TermT, TermT]) -> None:
+            nonlocal top
+
+            if top < len(equations):
+                equations[top] = equation
+            else:
+                equations.append(equation)
+
+            top += 1
+
+        while top:
+            top -= 1
+            left, right = equations[top]
+
+            if not is_var(left) and is_var(right):
+                left, right = right, left
+
+            if is_var(left):
+                left = find(left)
+
+                if is_var(right):
+                    right = find(right)
+
+                    if left == right:
+                        continue
+
+                    # merge the two classes, making 'right' the
+                    # representative; if 'left' was bound, its binding
+                    # carries over
+                    parent[left] = right
+                    bound.append(left)
+                    left_term = terms.pop(left, None)
+                    right_term = terms.get(right)
+
+                    if left_term is not None:
+                        if right_term is None:
+                            if occurs(right, left_term):
+                                raise UnificationError(
+                                    f'{right} occurs in {left_term}'
+                                )
+
+                            # 'right' becomes a bound representative, so it
+                            # belongs in the result too
+                            terms[right] = left_term
+                            bound.append(right)
+                        else:
+                            push((left_term, right_term))
+                    elif right_term is not None:
+                        # the class was already bound; now that 'left' has
+                        # joined it, the binding may have become cyclic
+                        if occurs(right, right_term):
+                            raise UnificationError(
+                                f'{right} occurs in {right_term}'
+                            )
 
-                for var, term in subst.items():
-                    subst[var] = cls.subst(new_subst, term)
+                    continue
+
+                left_term = terms.get(left)
 
-                subst |= new_subst
+                if left_term is not None:
+                    push((left_term, right))
+                    continue
+
+                if occurs(left, right):
+                    raise UnificationError(f'{left} occurs in {right}')
+
+                terms[left] = right
+                bound.append(left)
+                continue
+
+            if left == right:
                 continue
 
-            if cls.is_var(right):
-                equations.append((right, left))
+            decomposed = fast_decompose(left, right)
+
+            if decomposed is not None:
+                for equation in decomposed:
+                    push(equation)
+
                 continue
 
-            f = cls.fun_sym(left)
-            g = cls.fun_sym(right)
-            
+            f = fun_sym(left)
+            g = fun_sym(right)
+
             if f != g:
                 raise UnificationError(
                     f'cannot unify applications of {f} and {g}'
                 )
 
-            for larg, rarg in zip(cls.args(left), cls.args(right)):
-                equations.append((larg, rarg))
+            for larg, rarg in zip(args_of(left), args_of(right)):
+                push((larg, rarg))
+
+        # the live region is empty now; drop the dead entries too, so the
+        # caller's list is left consumed as before
+        equations.clear()
+
+        # apply the bindings to themselves to produce an ordinary,
+        # fully-resolved substitution
+        resolved: dict[int, TermT] = {}
+
+        def resolve(t: TermT) -> TermT:
+            if is_var(t):
+                root = find(t)
+                root_term = terms.get(root)
+                return root if root_term is None else resolve(root_term)
+
+            cached = resolved.get(id(t))
+
+            if cached is None:
+                args = args_of(t)
+                new_args = tuple(resolve(arg) for arg in args)
+
+                if all(new is old for new, old in zip(new_args, args)):
+                    cached = t
+                else:
+                    cached = apply(fun_sym(t), new_args)
+
+                resolved[id(t)] = cached
+
+            return cached
+
+        result: dict[VarT, TermT] = {}
+
+        for var in bound:
+            value = resolve(var)
+
+            if value != var:
+                result[var] = value
 
-        return subst
+        return result
 
     @classmethod     
     def unify2(